@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from lxml import etree
+
+from xsd_merge import XSDMerger
+
+XS_ELEMENT = '{http://www.w3.org/2001/XMLSchema}element'
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def _merge(*contents):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [_write(tmp, f'{i}.xsd', content) for i, content in enumerate(contents)]
+        merged = XSDMerger().merge_schemas(paths)
+        # Round-trip so only the declarations that survive serialization count
+        return etree.fromstring(etree.tostring(merged))
+
+
+def _resolve(elem, attribute):
+    prefix, _, local = elem.get(attribute).rpartition(':')
+    return elem.nsmap.get(prefix or None), local
+
+
+class MergeSchemasTest(unittest.TestCase):
+    def test_qname_prefixes_of_later_files_stay_declared(self):
+        merged = _merge(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="first" type="xs:string"/></xs:schema>',
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:a="urn:a">'
+            '<xs:element name="second" type="a:T"/>'
+            '<xs:complexType name="C"><xs:sequence><xs:element name="inner" type="a:U"/></xs:sequence>'
+            '</xs:complexType></xs:schema>',
+        )
+
+        elements = {elem.get('name'): elem for elem in merged.iter(XS_ELEMENT)}
+        self.assertEqual(_resolve(elements['second'], 'type'), ('urn:a', 'T'))
+        self.assertEqual(_resolve(elements['inner'], 'type'), ('urn:a', 'U'))
+        self.assertEqual(_resolve(elements['first'], 'type'), ('http://www.w3.org/2001/XMLSchema', 'string'))
+
+    def test_conflicting_prefixes_keep_their_own_binding(self):
+        merged = _merge(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:t" targetNamespace="urn:t">'
+            '<xs:element name="first" type="tns:A"/></xs:schema>',
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:other" xmlns:a="urn:t"'
+            ' targetNamespace="urn:t">'
+            '<xs:element name="second" type="tns:Q"/>'
+            '<xs:complexType name="B"><xs:sequence><xs:element name="inner" type="a:B"/></xs:sequence>'
+            '</xs:complexType></xs:schema>',
+        )
+
+        elements = {elem.get('name'): elem for elem in merged.iter(XS_ELEMENT)}
+        self.assertEqual(_resolve(elements['first'], 'type'), ('urn:t', 'A'))
+        self.assertEqual(_resolve(elements['second'], 'type'), ('urn:other', 'Q'))
+        self.assertEqual(_resolve(elements['inner'], 'type'), ('urn:t', 'B'))
+
+    def test_default_namespace_stays_with_its_own_file(self):
+        plain = ('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                 '<xs:element name="plain" type="Foo"/></xs:schema>')
+        with_default = ('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns="urn:t"'
+                        ' targetNamespace="urn:t"><xs:element name="defaulted" type="Bar"/></xs:schema>')
+
+        for contents in ((plain, with_default), (with_default, plain)):
+            merged = _merge(*contents)
+
+            elements = {elem.get('name'): elem for elem in merged.iter(XS_ELEMENT)}
+            self.assertEqual(_resolve(elements['plain'], 'type'), (None, 'Foo'))
+            self.assertEqual(_resolve(elements['defaulted'], 'type'), ('urn:t', 'Bar'))
+
+    def test_unmerged_top_level_nodes_are_released(self):
+        groups = ''.join(f'<xs:group name="g{i}"><xs:sequence><xs:element name="x{i}" type="xs:string"/>'
+                         f'</xs:sequence></xs:group><xs:complexType name="C{i}"/>' for i in range(3000))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write(tmp, 'groups.xsd',
+                          f'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">{groups}</xs:schema>')
+
+            attached = [len(elem.getparent()) for elem in XSDMerger().iter_xsd(path)]
+
+        self.assertEqual(len(attached), 3000)
+        # Only what libxml2 has read ahead is still attached, not every group seen so far
+        self.assertLess(max(attached), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from lxml import etree
+
+import xsd_parse
+from xsd_parse import XS_ELEMENT, _process_one, process_xsd_file
+
+
+def _write_large_schema(path, type_count, prolog='', root_namespaces='', extra=''):
+    # getCommencementsData -> T0 -> T1 -> ... -> T{type_count - 1}, plus an unreachable type per step
+    parts = [
+        f'{prolog}<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"{root_namespaces}>',
+        '<xs:complexType name="getCommencementsData"><xs:sequence>'
+        '<xs:element name="first" type="T0"/><xs:element name="flag" type="xs:boolean"/>'
+        '</xs:sequence></xs:complexType>',
+    ]
+    for i in range(type_count):
+        next_ref = f'<xs:element name="next" type="T{i + 1}"/>' if i + 1 < type_count else ''
+        parts.append(f'<xs:complexType name="T{i}"><xs:sequence>'
+                     f'<xs:element name="n{i}" type="xs:integer"/>{next_ref}'
+                     f'</xs:sequence></xs:complexType>')
+        parts.append(f'<xs:complexType name="U{i}"><xs:sequence>'
+                     f'<xs:element name="u{i}" type="xs:date"/>'
+                     f'</xs:sequence></xs:complexType>')
+        if i % 100 == 0:
+            parts.append(extra.replace('{i}', str(i)))
+    parts.append('</xs:schema>')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(parts))
+
+
+class ProcessXsdFileTest(unittest.TestCase):
+    def test_large_file_keeps_every_element(self):
+        # Well above libxml2's read buffer, so top-level children are still being parsed
+        # when the previous child is streamed out
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'large.xsd')
+            output_path = os.path.join(tmp, 'out', 'large.xsd')
+            _write_large_schema(input_path, 2000)
+            self.assertGreater(os.path.getsize(input_path), 64 * 1024)
+
+            with mock.patch.object(xsd_parse, 'STREAMING_MIN_SIZE', 0):
+                process_xsd_file(input_path, output_path)
+
+            source = etree.parse(input_path).getroot()
+            result = etree.parse(output_path).getroot()
+            self.assertEqual(len(list(result.iter(XS_ELEMENT))), len(list(source.iter(XS_ELEMENT))))
+
+            types = {elem.get('name'): elem.get('type') for elem in result.iter(XS_ELEMENT)}
+            self.assertEqual(types['flag'], 'xs:string')
+            self.assertEqual(types['n0'], 'xs:string')
+            self.assertEqual(types['n1999'], 'xs:string')
+            self.assertEqual(types['u0'], 'xs:date')
+            self.assertEqual(types['u1999'], 'xs:date')
+
+    def test_streamed_output_matches_in_memory_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'large.xsd')
+            _write_large_schema(
+                input_path, 2000,
+                prolog='<?xml version="1.0" encoding="UTF-8"?>\n<!-- before -->\n',
+                root_namespaces=' xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns="urn:t"'
+                                ' targetNamespace="urn:t"',
+                extra='<!-- step {i} --><xsd:simpleType name="S{i}" xmlns:p="urn:p">'
+                      '<xsd:annotation><xsd:documentation>zażółć {i}</xsd:documentation>'
+                      '</xsd:annotation><xs:restriction base="xsd:date"/></xsd:simpleType>')
+            with open(input_path, 'a', encoding='utf-8') as f:
+                f.write('\n<!-- after -->')
+
+            outputs = []
+            for threshold in (0, os.path.getsize(input_path) + 1):
+                output_path = os.path.join(tmp, str(threshold), 'large.xsd')
+                with mock.patch.object(xsd_parse, 'STREAMING_MIN_SIZE', threshold):
+                    process_xsd_file(input_path, output_path)
+                with open(output_path, 'rb') as f:
+                    outputs.append(f.read())
+
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertIn(b'<xsd:simpleType xmlns:p="urn:p" name="S0">', outputs[0])
+            self.assertEqual(outputs[0].count(b'xmlns:xsd='), 1)
+
+    def test_file_without_xsd_namespace_is_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'plain.xml')
+            output_path = os.path.join(tmp, 'out', 'plain.xml')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write('<root><child/></root>')
+
+            message = _process_one((input_path, output_path))
+
+            self.assertTrue(message.startswith('Warning: XSD namespace not found'))
+            self.assertFalse(os.path.exists(output_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
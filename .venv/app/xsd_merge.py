@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+import os
+import sys
+import glob
+from lxml import etree
+from typing import Dict, Set, List, Iterable, Iterator, Optional, Tuple
+
+
+_made_dirs: Set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path not in _made_dirs:
+        os.makedirs(path, exist_ok=True)
+        _made_dirs.add(path)
+
+
+class XSDMerger:
+    _XS = '{http://www.w3.org/2001/XMLSchema}'
+    _TAG_ELEMENT = _XS + 'element'
+    _TAG_COMPLEX = _XS + 'complexType'
+    _TAG_SIMPLE = _XS + 'simpleType'
+    _TAG_IMPORT = _XS + 'import'
+    _TAG_INCLUDE = _XS + 'include'
+    _TAG_SCHEMA = _XS + 'schema'
+    _SYMBOL_SPACES = {
+        _TAG_ELEMENT: 'element',
+        _TAG_COMPLEX: 'type',
+        _TAG_SIMPLE: 'type',
+    }
+
+    __slots__ = ('ns_map', '_seen', '_seen_refs', '_merged', '_schema_attrib', '_schema_nsmap',
+                 '_default_namespaces', 'merged_root', 'target_namespace', '_passthrough_tags')
+
+    def __init__(self):
+        self.ns_map = {
+            'xs': 'http://www.w3.org/2001/XMLSchema'
+        }
+        self._seen: Dict[Tuple[str, str], etree._Element] = {}
+        self._seen_refs: Set[Tuple[str, str, str]] = set()
+        self._merged: List[Tuple[etree._Element, Dict[str, str]]] = []
+        self._schema_attrib: Optional[Dict[str, str]] = None
+        self._schema_nsmap: Dict[str, str] = {}
+        self._default_namespaces: Set[Optional[str]] = set()
+        self.merged_root = None
+        self.target_namespace = ""
+        self._passthrough_tags = frozenset({self._TAG_IMPORT, self._TAG_INCLUDE})
+
+    def iter_xsd(self, file_path: str) -> Iterator[etree._Element]:
+        tags = (self._TAG_ELEMENT, self._TAG_COMPLEX, self._TAG_SIMPLE,
+                self._TAG_IMPORT, self._TAG_INCLUDE)
+        try:
+            context = etree.iterparse(file_path, events=('end',), tag=tags, remove_comments=True,
+                                      remove_blank_text=True, collect_ids=False)
+            schema = None
+            for _, elem in context:
+                if schema is None:
+                    schema = elem.getroottree().getroot()
+                    self._register_schema(schema)
+                if elem.getparent() is schema:
+                    yield elem
+                    # Top-level nodes that are not merged (annotation, group, attributeGroup, ...)
+                    # have no events of their own; drop the finished ones before this element too
+                    while elem.getprevious() is not None:
+                        del schema[0]
+                    schema.remove(elem)
+            if schema is None:
+                self._register_schema(context.root)
+        except Exception as e:
+            print(f"Błąd podczas wczytywania pliku {file_path}: {e}")
+            sys.exit(1)
+
+    def _register_schema(self, schema: etree._Element) -> None:
+        if self._schema_attrib is None:
+            self.target_namespace = schema.get('targetNamespace', '')
+            self._schema_attrib = dict(schema.attrib)
+        # The merged root declares the union of the source prefixes; the first file to bind a
+        # prefix wins, later files binding it to another URI are handled in initialize_merged_schema
+        for prefix, uri in schema.nsmap.items():
+            self._schema_nsmap.setdefault(prefix, uri)
+        self._default_namespaces.add(schema.nsmap.get(None))
+
+    def initialize_merged_schema(self) -> etree._Element:
+        root_nsmap = dict(self._schema_nsmap)
+        # An unprefixed name means something different in a file without the default namespace, so
+        # the root only declares it when every file binds it to the same URI
+        if len(self._default_namespaces) > 1:
+            root_nsmap.pop(None, None)
+        merged_schema = etree.Element(self._TAG_SCHEMA, attrib=self._schema_attrib, nsmap=root_nsmap)
+        root_namespaces = merged_schema.nsmap.items()
+
+        for child, nsmap in self._merged:
+            if nsmap.items() <= root_namespaces:
+                merged_schema.append(child)
+            else:
+                # The child's file binds a prefix differently than the merged root (or declares
+                # one on the child itself). lxml only keeps prefixes used in tag and attribute
+                # names, so QName values like type="tns:T" would resolve against the root's
+                # binding. Recreate the child in place with its own full nsmap instead.
+                shell = etree.SubElement(merged_schema, child.tag, attrib=dict(child.attrib), nsmap=nsmap)
+                shell.text = child.text
+                shell.extend(list(child))
+
+        return merged_schema
+
+    def get_type_name(self, elem: etree._Element) -> str:
+        return elem.get('name', '')
+
+    def merge_schemas(self, file_paths: List[str]) -> etree._Element:
+        if not file_paths:
+            print("Nie podano żadnych plików do połączenia.")
+            sys.exit(1)
+
+        for file_path in file_paths:
+            self._process_schema(self.iter_xsd(file_path))
+
+        self.merged_root = self.initialize_merged_schema()
+        return self.merged_root
+
+    def _process_schema(self, children: Iterable[etree._Element]) -> None:
+        seen = self._seen
+        symbol_spaces = self._SYMBOL_SPACES
+        seen_refs = self._seen_refs
+        merged = self._merged
+        passthrough_tags = self._passthrough_tags
+        get_type_name = self.get_type_name
+
+        for child in children:
+            tag = child.tag
+            space = symbol_spaces.get(tag)
+            if space is not None:
+                key = (space, get_type_name(child))
+                if key[1] and key not in seen:
+                    seen[key] = child
+                    merged.append((child, child.nsmap))
+
+            elif tag in passthrough_tags:
+                ref = (tag, child.get('schemaLocation', ''), child.get('namespace', ''))
+                if ref not in seen_refs:
+                    seen_refs.add(ref)
+                    merged.append((child, child.nsmap))
+
+    def save_merged_schema(self, output_path: str) -> None:
+        if self.merged_root is None:
+            print("Nie utworzono jeszcze połączonego schematu.")
+            return
+
+        _ensure_dir(os.path.dirname(output_path))
+
+        tree = etree.ElementTree(self.merged_root)
+
+        tree.write(
+            output_path,
+            encoding='utf-8',
+            xml_declaration=True,
+            pretty_print=True
+        )
+        print(f"Zapisano połączony schemat do pliku: {output_path}")
+
+
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    input_dir = os.path.join(base_dir, 'xsd_merged_input')
+    output_dir = os.path.join(base_dir, 'xsd_merged_output')
+
+    if not os.path.isdir(input_dir):
+        print(f"Katalog wejściowy nie istnieje: {input_dir}")
+        sys.exit(1)
+
+    _ensure_dir(output_dir)
+
+    xsd_files = glob.glob(os.path.join(input_dir, '*.xsd'))
+
+    if not xsd_files:
+        print(f"Nie znaleziono plików XSD w katalogu: {input_dir}")
+        sys.exit(1)
+
+    print(f"Znaleziono {len(xsd_files)} plików XSD do połączenia.")
+
+    merger = XSDMerger()
+    merger.merge_schemas(xsd_files)
+
+    output_file = os.path.join(output_dir, 'merged_schema.xsd')
+    merger.save_merged_schema(output_file)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,260 @@
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from lxml import etree
+
+XS_URI = "http://www.w3.org/2001/XMLSchema"
+XS = f"{{{XS_URI}}}"
+XS_ELEMENT = f"{XS}element"
+XS_COMPLEX_TYPE = f"{XS}complexType"
+
+# Built-in types rewritten to xs:string, without the file-specific prefix
+SCALAR_TYPE_NAMES = ("integer", "boolean", "dateTime", "date")
+
+GC_TYPE_NAME = "getCommencementsData"
+
+# Files at least this large are streamed instead of being parsed into one tree
+STREAMING_MIN_SIZE = 32 * 1024 * 1024
+
+# Shared by every file parsed in this process; xml:id lookups are never used
+_PARSER = etree.XMLParser(remove_blank_text=True, collect_ids=False)
+
+
+# Directories already created by this process, so repeated files skip the makedirs syscalls
+_made_dirs = set()
+
+
+def _ensure_dir(path):
+    if path not in _made_dirs:
+        os.makedirs(path, exist_ok=True)
+        _made_dirs.add(path)
+
+
+# Related XSDs usually declare the same namespaces, so the lookup is cached by nsmap content.
+# Returns "" when the XSD namespace is the default one and None when it is not declared.
+@lru_cache(maxsize=None)
+def _xs_prefix(nsmap_items):
+    for prefix, uri in nsmap_items:
+        if uri == XS_URI:
+            return prefix or ""
+    return None
+
+
+def _iter_schema_chunks(input_path):
+    # Stream the file and yield (root, nodes) each time a top-level child is complete; nodes is the
+    # child preceded by any comments before it. Only those finished nodes are dropped afterwards -
+    # libxml2 may already be building the next sibling - so memory stays bounded by the largest
+    # top-level definition. A last chunk with any trailing comments is yielded at the end.
+    context = etree.iterparse(input_path, events=('end',), remove_blank_text=True, collect_ids=False)
+    root = None
+    for _, elem in context:
+        if root is None:
+            root = elem.getroottree().getroot()
+        if elem.getparent() is root:
+            nodes = list(elem.itersiblings(preceding=True))
+            nodes.reverse()
+            nodes.append(elem)
+            yield root, nodes
+            for _ in nodes:
+                del root[0]
+    yield context.root, list(context.root)
+
+
+def _collect_type_references(chunks):
+    # First pass: record the type names referenced by the elements of every complex type
+    type_refs = {}
+    gc_refs = set()
+    for root, nodes in chunks:
+        for node in nodes:
+            for complex_type in node.iter(XS_COMPLEX_TYPE):
+                name = complex_type.get('name')
+                refs = {elem.get('type') for elem in complex_type.iter(XS_ELEMENT)}
+                refs.discard(None)
+                # First definition wins for the type walk; every getCommencementsData counts
+                type_refs.setdefault(name, refs)
+                if name == GC_TYPE_NAME:
+                    gc_refs |= refs
+    return root, type_refs, gc_refs
+
+
+def _rewrite_scalar_types(nodes, seen_types, processed_types, scalar_types, string_type):
+    # Convert integer, boolean, dateTime, and date to string inside getCommencementsData and the
+    # first definition of every type it reaches
+    for node in nodes:
+        for complex_type in node.iter(XS_COMPLEX_TYPE):
+            name = complex_type.get('name')
+            first_definition = name not in seen_types
+            seen_types.add(name)
+            if name == GC_TYPE_NAME or (first_definition and name in processed_types):
+                for elem in complex_type.iter(XS_ELEMENT):
+                    if elem.get('type') in scalar_types:
+                        # Replace with string type while keeping the namespace prefix
+                        elem.set('type', string_type)
+
+
+def _document_head(root):
+    # What tree.write() puts before the root's content - declaration, prolog and the root's start
+    # tag - taken from lxml's own output: serialized with two different root texts, the output
+    # diverges exactly where the content starts
+    tree = root.getroottree()
+    text = root.text
+    heads = []
+    for marker in ("a", "b"):
+        root.text = marker
+        heads.append(etree.tostring(tree, encoding='UTF-8', xml_declaration=True, pretty_print=True))
+    root.text = text
+    return os.path.commonprefix(heads)
+
+
+def _root_declarations(root):
+    # Namespace declarations of the root as lxml writes them, e.g. (uri, b' xmlns:xs="..."') by
+    # prefix; serializing a child on its own repeats these on its start tag
+    declarations = {}
+    for prefix, uri in root.nsmap.items():
+        serialized = etree.tostring(etree.Element("x", nsmap={prefix: uri}), encoding='UTF-8')
+        declarations[prefix] = (uri, serialized[2:-2])
+    return declarations
+
+
+def _write_streamed(input_path, output_file, rewrite):
+    # Second pass for large files: rewrite and write each finished top-level node as it arrives.
+    # The output is byte-for-byte what tree.write(pretty_print=True) gives for the whole tree: every
+    # node is serialized where it is, so it keeps its prefixes, and the root's declarations that
+    # lxml repeats on it are removed again. The one difference: a child redeclaring one of the
+    # root's prefixes with the same URI looks identical to one inheriting it, so that redundant
+    # declaration is dropped.
+    head = None
+    for root, nodes in _iter_schema_chunks(input_path):
+        if nodes and head is None:
+            head = _document_head(root)
+            declarations = _root_declarations(root)
+            output_file.write(head)
+        rewrite(nodes)
+        for node in nodes:
+            if isinstance(node.tag, str):
+                etree.indent(node, level=1)
+            data = etree.tostring(node, encoding='UTF-8', with_tail=False)
+            if isinstance(node.tag, str):
+                nsmap = node.nsmap
+                for prefix, (uri, declaration) in declarations.items():
+                    if nsmap.get(prefix) == uri:
+                        data = data.replace(declaration, b"", 1)
+            output_file.write(b"\n  " + data)
+
+    tree = root.getroottree()
+    if head is None:
+        tree.write(output_file, encoding='utf-8', xml_declaration=True, pretty_print=True)
+        return
+
+    # Closing tag and anything after the root, again as lxml writes them
+    del root[:]
+    root.text = "a"
+    document = etree.tostring(tree, encoding='UTF-8', xml_declaration=True, pretty_print=True)
+    output_file.write(b"\n" + document[len(head) + 1:])
+
+
+def process_xsd_file(input_path, output_path):
+    # Small files are rewritten in memory, which is faster; larger ones are streamed twice
+    streaming = os.path.getsize(input_path) >= STREAMING_MIN_SIZE
+    if streaming:
+        chunks = _iter_schema_chunks(input_path)
+    else:
+        tree = etree.parse(input_path, _PARSER)
+        chunks = [(tree.getroot(), list(tree.getroot()))]
+    root, type_refs, gc_refs = _collect_type_references(chunks)
+
+    # Find namespace prefix for xs
+    xs_prefix = _xs_prefix(tuple(root.nsmap.items()))
+
+    # Without the XSD namespace there is nothing to rewrite; the caller reports the skip
+    if xs_prefix is None:
+        return False
+
+    # Prefix marking built-in XSD types, which are never followed as nested types
+    xs_colon = f"{xs_prefix}:"
+
+    # Types rewritten to string, with the prefix this file uses for the XSD namespace
+    scalar_types = frozenset(xs_colon + name for name in SCALAR_TYPE_NAMES)
+    string_type = xs_colon + "string"
+
+    # Find all complex types reachable from getCommencementsData
+    complex_types_to_process = deque(ref for ref in gc_refs if not ref.startswith(xs_colon))
+    processed_types = set()
+
+    while complex_types_to_process:
+        current_type = complex_types_to_process.popleft()
+        if current_type in processed_types:
+            continue
+
+        processed_types.add(current_type)
+
+        for nested_type in type_refs.get(current_type, ()):
+            if not nested_type.startswith(xs_colon) and nested_type not in processed_types:
+                complex_types_to_process.append(nested_type)
+
+    # Create output directory if it doesn't exist
+    _ensure_dir(os.path.dirname(output_path))
+
+    # Second pass: convert the scalar types and write the result
+    seen_types = set()
+    if not streaming:
+        _rewrite_scalar_types(list(root), seen_types, processed_types, scalar_types, string_type)
+        tree.write(output_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+        return True
+
+    with open(output_path, 'wb') as output_file:
+        _write_streamed(input_path, output_file,
+                        lambda nodes: _rewrite_scalar_types(nodes, seen_types, processed_types,
+                                                            scalar_types, string_type))
+
+    return True
+
+
+def _process_one(task):
+    input_path, output_path = task
+    try:
+        if not process_xsd_file(input_path, output_path):
+            return f"Warning: XSD namespace not found in {input_path}, skipping file."
+        return f"Processed: {input_path} -> {output_path}"
+    except Exception as e:
+        return f"Error processing {input_path}: {str(e)}"
+
+
+def process_directory():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    input_dir = os.path.join(script_dir, '..', '..', 'xsd')
+    output_dir = os.path.join(script_dir, '..', '..', 'xsd_parsed_output')
+
+    _ensure_dir(output_dir)
+
+    if not os.path.exists(input_dir):
+        print(f"Error: Input directory '{input_dir}' does not exist.")
+        return
+
+    tasks = []
+
+    for root, _, files in os.walk(input_dir):
+        for file in files:
+            if file.lower().endswith('.xsd'):
+                input_path = os.path.join(root, file)
+                rel_path = os.path.relpath(input_path, input_dir)
+                output_path = os.path.join(output_dir, rel_path)
+                output_subdir = os.path.dirname(output_path)
+                _ensure_dir(output_subdir)
+                tasks.append((input_path, output_path))
+
+    if not tasks:
+        print(f"No XSD files found in '{input_dir}'.")
+        return
+
+    # Files are independent, so each worker parses and writes its own file
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(_process_one, tasks):
+            print(message)
+
+
+if __name__ == "__main__":
+    process_directory()
\ No newline at end of file